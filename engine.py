@@ -6,9 +6,31 @@ import pygame
 from pygame.locals import *
 import numpy as np
 import glm  # PyGLM for math
+import OpenGL
+# PyOpenGL reads these flags at import time, so they must be set before
+# OpenGL.GL is imported. glGetError round-trips on every call are skipped.
+OpenGL.ERROR_CHECKING = False
+OpenGL.ERROR_LOGGING = False
+OpenGL.ERROR_ON_COPY = True
+OpenGL.STORE_POINTERS = False
 from OpenGL.GL import *
+from OpenGL.GL.ARB.buffer_storage import glInitBufferStorageARB
+import ctypes
+import io
+import math
+import mmap
 import os
 
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    # Numba is optional. Without it the byte scanner below would be far slower
+    # than splitting lines, so load_custom_off uses parse_off_lines instead.
+    HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        return lambda func: func
+
 # --- 1. SHADER CODE (GLSL) ---
 VERTEX_SHADER = """
 #version 330 core
@@ -18,9 +40,13 @@ out vec3 vertexColor;
 uniform mat4 model;
 uniform mat4 view;
 uniform mat4 projection;
+uniform vec3 positionScale;
+uniform vec3 positionOffset;
 void main()
 {
-    gl_Position = projection * view * model * vec4(aPos, 1.0);
+    // aPos arrives as normalized int16 in [-1, 1]; expand back to mesh units.
+    vec3 position = aPos * positionScale + positionOffset;
+    gl_Position = projection * view * model * vec4(position, 1.0);
     vertexColor = aColor;
 }
 """
@@ -59,46 +85,258 @@ def create_shader_program(vertex_source, fragment_source):
     glDeleteShader(fragment_shader)
     return program
 
+def upload_static_buffer(target, data):
+    """
+    Uploads a numpy array into the buffer bound to target. Uses immutable
+    storage when GL_ARB_buffer_storage is available, glBufferData otherwise.
+    Empty arrays always take glBufferData, since glBufferStorage rejects size 0.
+    """
+    if data.nbytes and glInitBufferStorageARB():
+        glBufferStorage(target, data.nbytes, data, 0)
+    else:
+        glBufferData(target, data.nbytes, data, GL_STATIC_DRAW)
+
+def look_at(eye, forward, up, out):
+    """
+    Writes the view matrix glm.lookAt(eye, eye + forward, up) would build
+    into out, a (4, 4) float32 array, in OpenGL's column-major order.
+    """
+    f = forward / np.linalg.norm(forward)
+    s = np.cross(f, up)
+    s /= np.linalg.norm(s)
+    u = np.cross(s, f)
+    # Fill through the transpose so out's memory ends up column-major.
+    m = out.T
+    m[0, :3] = s
+    m[1, :3] = u
+    m[2, :3] = -f
+    m[:3, 3] = -(m[:3, :3] @ eye)
+    m[3] = (0.0, 0.0, 0.0, 1.0)
+    return out
+
+@njit(cache=True)
+def _skip_spaces(buf, pos):
+    # Spaces, tabs and carriage returns, but not newlines.
+    while pos < buf.size and (buf[pos] == 32 or buf[pos] == 9 or buf[pos] == 13):
+        pos += 1
+    return pos
+
+@njit(cache=True)
+def _skip_line(buf, pos):
+    while pos < buf.size and buf[pos] != 10:
+        pos += 1
+    return pos + 1
+
+@njit(cache=True)
+def _skip_blank_lines(buf, pos):
+    # Skips whitespace, empty lines and '#' comment lines up to the next record.
+    while pos < buf.size:
+        c = buf[pos]
+        if c == 35:
+            pos = _skip_line(buf, pos)
+        elif c == 32 or 9 <= c <= 13:
+            pos += 1
+        else:
+            break
+    if pos >= buf.size:
+        raise ValueError("Unexpected end of .off file.")
+    return pos
+
+@njit(cache=True)
+def _parse_int(buf, pos):
+    pos = _skip_spaces(buf, pos)
+    sign = 1
+    if pos < buf.size and (buf[pos] == 45 or buf[pos] == 43):
+        if buf[pos] == 45:
+            sign = -1
+        pos += 1
+    start = pos
+    value = 0
+    while pos < buf.size and 48 <= buf[pos] <= 57:
+        value = value * 10 + (int(buf[pos]) - 48)
+        pos += 1
+    if pos == start:
+        raise ValueError("Malformed integer in .off file.")
+    return sign * value, pos
+
+@njit(cache=True)
+def _parse_float(buf, pos):
+    pos = _skip_spaces(buf, pos)
+    sign = 1.0
+    if pos < buf.size and (buf[pos] == 45 or buf[pos] == 43):
+        if buf[pos] == 45:
+            sign = -1.0
+        pos += 1
+    start = pos
+    mantissa = 0.0
+    exponent = 0
+    while pos < buf.size and 48 <= buf[pos] <= 57:
+        mantissa = mantissa * 10.0 + (int(buf[pos]) - 48)
+        pos += 1
+    if pos < buf.size and buf[pos] == 46:
+        pos += 1
+        while pos < buf.size and 48 <= buf[pos] <= 57:
+            mantissa = mantissa * 10.0 + (int(buf[pos]) - 48)
+            exponent -= 1
+            pos += 1
+    if pos == start:
+        raise ValueError("Malformed number in .off file.")
+    if pos < buf.size and (buf[pos] == 101 or buf[pos] == 69):
+        e, pos = _parse_int(buf, pos + 1)
+        exponent += e
+    return sign * mantissa * 10.0 ** exponent, pos
+
+@njit(cache=True)
+def parse_off(buf, pos, num_vertices, num_faces):
+    """
+    Byte-level parser for the vertex and face sections of an .off file,
+    starting at offset pos of buf (a uint8 array). Returns the vertex
+    positions plus the indices and 0-255 colors of the triangle faces.
+    """
+    vertex_positions = np.empty((num_vertices, 3), dtype=np.float32)
+    for i in range(num_vertices):
+        pos = _skip_blank_lines(buf, pos)
+        for k in range(3):
+            value, pos = _parse_float(buf, pos)
+            vertex_positions[i, k] = value
+        pos = _skip_line(buf, pos)
+
+    idx = np.empty((num_faces, 3), dtype=np.int32)
+    col = np.empty((num_faces, 3), dtype=np.float32)
+    num_triangles = 0
+    for i in range(num_faces):
+        pos = _skip_blank_lines(buf, pos)
+        count, pos = _parse_int(buf, pos)
+        if count == 3:
+            for k in range(3):
+                index, pos = _parse_int(buf, pos)
+                idx[num_triangles, k] = index
+            for k in range(3):
+                value, pos = _parse_float(buf, pos)
+                col[num_triangles, k] = value
+            num_triangles += 1
+        pos = _skip_line(buf, pos)
+
+    return vertex_positions, idx[:num_triangles], col[:num_triangles]
+
+def parse_off_lines(body, num_vertices, num_faces):
+    """
+    Plain-Python counterpart of parse_off for when Numba is not installed.
+    Splits each line of the bytes body like the original parser, skipping
+    blank and '#' comment lines, and returns the same three arrays.
+    """
+    records = (line.split() for line in body.splitlines())
+    records = (parts for parts in records if parts and not parts[0].startswith(b'#'))
+
+    vertex_positions = np.empty((num_vertices, 3), dtype=np.float32)
+    for i in range(num_vertices):
+        parts = next(records, None)
+        if parts is None:
+            raise ValueError("Unexpected end of .off file.")
+        if len(parts) < 3:
+            raise ValueError("Malformed vertex in .off file.")
+        vertex_positions[i] = [float(p) for p in parts[:3]]
+
+    idx = []
+    col = []
+    for i in range(num_faces):
+        parts = next(records, None)
+        if parts is None:
+            raise ValueError("Unexpected end of .off file.")
+        if int(parts[0]) != 3: continue
+        if len(parts) < 7:
+            raise ValueError("Malformed face in .off file.")
+        idx.append([int(p) for p in parts[1:4]])
+        col.append([float(p) for p in parts[4:7]])
+
+    return (vertex_positions,
+            np.array(idx, dtype=np.int32).reshape(-1, 3),
+            np.array(col, dtype=np.float32).reshape(-1, 3))
+
+def _skip_lines(mm, start, num_lines, chunk_size=1 << 22):
+    """
+    Returns the offset just past the num_lines-th newline at or after start,
+    or len(mm) if the file ends first. Newlines are counted one chunk at a
+    time so no file-sized temporary is built.
+    """
+    pos = start
+    while num_lines > 0 and pos < len(mm):
+        chunk = mm[pos:pos + chunk_size]
+        count = chunk.count(b'\n')
+        if count >= num_lines:
+            newlines = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == ord('\n'))
+            return pos + int(newlines[num_lines - 1]) + 1
+        num_lines -= count
+        pos += len(chunk)
+    return pos if num_lines == 0 else len(mm)
+
 def load_custom_off(filepath, progress_callback=None):
     """
     Custom parser for the .off file format. Calls a callback function
     to update a loading screen.
     """
     print(f"Loading custom .off mesh: {filepath}")
+    mm = None
     try:
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-
-        header = lines[0].strip()
-        if 'COFF' not in header and 'OFF' not in header:
+        # Map the file instead of reading it into Python strings; each section
+        # is handed to numpy as one bytes block.
+        with open(filepath, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header_end = mm.find(b'\n')
+        counts_end = mm.find(b'\n', header_end + 1)
+        if header_end < 0 or counts_end < 0:
+            raise ValueError("Unexpected end of .off file.")
+        header = mm[:header_end].strip()
+        if b'COFF' not in header and b'OFF' not in header:
             raise ValueError("Invalid OFF file header.")
-        
-        counts = list(map(int, lines[1].strip().split()))
+        counts = list(map(int, mm[header_end + 1:counts_end].split()))
         num_vertices, num_faces = counts[0], counts[1]
 
-        vertex_positions = []
-        for i in range(num_vertices):
-            vertex_positions.append(list(map(float, lines[2 + i].strip().split())))
-
-        final_vertices = []
-        final_colors = []
-
-        for i in range(num_faces):
-            if progress_callback and (i % 15000 == 0 or i == num_faces - 1):
-                progress_percentage = (i + 1) / num_faces
-                progress_callback(progress_percentage, f"Parsing faces: {i+1}/{num_faces}")
-
-            parts = lines[2 + num_vertices + i].strip().split()
-            if int(parts[0]) != 3: continue
-
-            idx1, idx2, idx3 = int(parts[1]), int(parts[2]), int(parts[3])
-            color = [float(parts[4]) / 255.0, float(parts[5]) / 255.0, float(parts[6]) / 255.0]
-
-            final_vertices.extend([vertex_positions[idx1], vertex_positions[idx2], vertex_positions[idx3]])
-            final_colors.extend([color, color, color])
-        
-        vertices_np = np.array(final_vertices, dtype=np.float32)
-        colors_np = np.array(final_colors, dtype=np.float32)
+        vertex_start = counts_end + 1
+        face_start = _skip_lines(mm, vertex_start, num_vertices)
+        face_end = _skip_lines(mm, face_start, num_faces)
+
+        if progress_callback:
+            progress_callback(0.0, f"Parsing vertices: {num_vertices}")
+        try:
+            vertex_positions = np.loadtxt(io.BytesIO(mm[vertex_start:face_start]), max_rows=num_vertices,
+                                          usecols=(0, 1, 2), dtype=np.float32, ndmin=2)
+            # max_rows is only an upper bound; a truncated file must not load.
+            if len(vertex_positions) != num_vertices:
+                raise ValueError("Unexpected end of .off file.")
+
+            if progress_callback:
+                progress_callback(0.5, f"Parsing faces: {num_faces}")
+            # Faces are "3 i1 i2 i3 r g b [a]". Parsed as float64 so vertex indices
+            # above 2**24 survive the round trip; non-triangle faces are dropped.
+            faces = np.loadtxt(io.BytesIO(mm[face_start:face_end]), max_rows=num_faces,
+                               usecols=range(7), dtype=np.float64, ndmin=2)
+            if len(faces) != num_faces:
+                raise ValueError("Unexpected end of .off file.")
+            faces = faces[faces[:, 0] == 3]
+            idx = np.ascontiguousarray(faces[:, 1:4], dtype=np.int32)
+            col = faces[:, 4:7]
+        except ValueError:
+            # np.loadtxt needs uniform rows; fall back to a token parser for
+            # files with short face lines (e.g. uncolored polygons). The body
+            # is copied out of the map because Numba leaks a reference to its
+            # arguments when it raises, which would keep the map from closing.
+            body = mm[vertex_start:]
+            if HAVE_NUMBA:
+                vertex_positions, idx, col = parse_off(np.frombuffer(body, dtype=np.uint8),
+                                                       0, num_vertices, num_faces)
+            else:
+                vertex_positions, idx, col = parse_off_lines(body, num_vertices, num_faces)
+
+        # Gather all three corners of every face in one pass instead of
+        # building intermediate Python lists.
+        vertices_np = np.ascontiguousarray(vertex_positions[idx].reshape(-1, 3), dtype=np.float32)
+        # Colors stay 0-255 bytes; the GPU normalizes them on attribute fetch.
+        colors_np = np.repeat(np.clip(col, 0, 255).astype(np.uint8), 3, axis=0)
+
+        if progress_callback:
+            progress_callback(1.0, f"Parsing faces: {num_faces}/{num_faces}")
 
         print(f"Mesh loaded successfully: {len(vertices_np)} vertices.")
         return vertices_np, colors_np
@@ -107,53 +345,185 @@ def load_custom_off(filepath, progress_callback=None):
         print(f"Error loading custom .off mesh: {e}")
         return None, None
 
-# --- 3. CAMERA CLASS ---
+    finally:
+        if mm is not None:
+            mm.close()
+
+# One interleaved vertex: normalized int16 position plus normalized uint8
+# color, each padded to a 4-component slot so attributes stay 4-byte aligned.
+VERTEX_DTYPE = np.dtype([('position', np.int16, 4), ('color', np.uint8, 4)])
+
+def quantize_positions(positions):
+    """
+    Maps positions onto the int16 range of the mesh bounding box. Returns
+    (quantized, scale, offset) where positions ~= quantized / 32767 * scale + offset.
+    """
+    if len(positions) == 0:
+        # A mesh without triangles draws nothing; avoid reducing an empty array.
+        return positions.astype(np.int16), np.ones(3, dtype=np.float32), np.zeros(3, dtype=np.float32)
+    bbox_min, bbox_max = positions.min(axis=0), positions.max(axis=0)
+    offset = ((bbox_min + bbox_max) / 2).astype(np.float32)
+    scale = ((bbox_max - bbox_min) / 2).astype(np.float32)
+    scale[scale == 0] = 1.0
+    quantized = np.rint((positions - offset) / scale * 32767).astype(np.int16)
+    return quantized, scale, offset
+
+def interleave_vertices(positions, colors):
+    vertices = np.zeros(len(positions), dtype=VERTEX_DTYPE)
+    vertices['position'][:, :3] = positions
+    vertices['color'][:, :3] = colors
+    return vertices
+
+def index_mesh(vertices, colors, max_unique_ratio=0.7):
+    """
+    Merges corners that share both position and color so the mesh can be
+    drawn with an index buffer. Returns (vertices, colors, indices), where
+    indices is None when too few corners are shared for indexing to pay off
+    (splat meshes carry a color per face, so they rarely share any).
+    """
+    combined = interleave_vertices(vertices, colors)
+    # Compare whole records as raw bytes; the padding byte is always zero.
+    keys = combined.view(np.dtype((np.void, VERTEX_DTYPE.itemsize)))
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    if len(first) > max_unique_ratio * len(combined):
+        print(f"Mesh not indexed: {len(first)} unique of {len(combined)} vertices.")
+        return vertices, colors, None
+
+    # np.unique orders vertices by their bytes; renumber them by first use so
+    # the index stream stays close to sequential for the vertex fetch cache.
+    order = np.argsort(first)
+    remap = np.empty(len(order), dtype=np.uint32)
+    remap[order] = np.arange(len(order), dtype=np.uint32)
+    indices = remap[inverse.reshape(-1)]
+    unique = combined[first[order]]
+    print(f"Mesh indexed: {len(unique)} unique of {len(combined)} vertices.")
+    return unique['position'][:, :3], unique['color'][:, :3], indices
+
+# --- 3. MESH BUFFER CLASS ---
+class StaticMeshBuffer:
+    """
+    Owns the VAO, the immutable interleaved position/color VBO and, when
+    indices is not None, the index buffer of a static mesh.
+    """
+    def __init__(self, positions, colors, indices):
+        # Interleave position and color so each vertex is fetched from one stream.
+        interleaved = interleave_vertices(positions, colors)
+        stride = VERTEX_DTYPE.itemsize
+        color_offset = VERTEX_DTYPE.fields['color'][1]
+
+        self.vao = glGenVertexArrays(1)
+        glBindVertexArray(self.vao)
+        self.vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        upload_static_buffer(GL_ARRAY_BUFFER, interleaved.view(np.uint8))
+        glVertexAttribPointer(0, 3, GL_SHORT, GL_TRUE, stride, ctypes.c_void_p(0))
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(1, 3, GL_UNSIGNED_BYTE, GL_TRUE, stride, ctypes.c_void_p(color_offset))
+        glEnableVertexAttribArray(1)
+        self.ebo = None
+        if indices is not None:
+            self.ebo = glGenBuffers(1)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ebo)
+            upload_static_buffer(GL_ELEMENT_ARRAY_BUFFER, indices)
+        glBindVertexArray(0)
+        self.count = GLsizei(len(positions) if indices is None else len(indices))
+
+    def bind(self):
+        glBindVertexArray(self.vao)
+
+    def draw(self):
+        if self.ebo is None:
+            glDrawArrays(GL_TRIANGLES, 0, self.count)
+        else:
+            glDrawElements(GL_TRIANGLES, self.count, GL_UNSIGNED_INT, None)
+
+    def delete(self):
+        glDeleteVertexArrays(1, np.array([self.vao], dtype=np.uint32))
+        buffers = [self.vbo] if self.ebo is None else [self.vbo, self.ebo]
+        glDeleteBuffers(len(buffers), np.array(buffers, dtype=np.uint32))
+
+# --- 4. CAMERA CLASS ---
+WORLD_UP = np.array([0.0, 1.0, 0.0], dtype=np.float32)
+
 class Camera:
-    def __init__(self, position=glm.vec3(0, 2, 20), speed=5.0):
-        self.position = position
+    def __init__(self, position=(0.0, 2.0, 20.0), speed=5.0):
+        # Position, direction vectors and the view matrix are float32 numpy
+        # arrays, so the per-frame camera math never goes through PyGLM.
+        self.position = np.array(position, dtype=np.float32)
         self.yaw = -90.0
         self.pitch = 0.0
         self.speed = speed
         self.mouse_sensitivity = 0.1
+        self._fwd = np.zeros(3, dtype=np.float32)
+        self._right = np.zeros(3, dtype=np.float32)
+        self._view_scratch = np.empty((4, 4), dtype=np.float32)
+        self._scratch = np.zeros(3, dtype=np.float32)
+        self._dirty = True
+        self._view_stale = True
         pygame.mouse.set_visible(False)
         pygame.event.set_grab(True)
 
-    def get_view_matrix(self):
-        forward = self.get_forward_vector()
-        world_up = glm.vec3(0, 1, 0)
-        return glm.lookAt(self.position, self.position + forward, world_up)
-
     def get_forward_vector(self):
-        direction = glm.vec3()
-        direction.x = glm.cos(glm.radians(self.yaw)) * glm.cos(glm.radians(self.pitch))
-        direction.y = glm.sin(glm.radians(self.pitch))
-        direction.z = glm.sin(glm.radians(self.yaw)) * glm.cos(glm.radians(self.pitch))
-        return glm.normalize(direction)
-
-    def process_input(self, keys, mouse_rel, delta_time):
+        if self._dirty:
+            self._update_forward()
+        return self._fwd
+
+    def _update_forward(self):
+        # Only recomputed when yaw/pitch change; both vectors are unit length.
+        # right == normalize(cross(forward, WORLD_UP)), which only depends on yaw.
+        yaw, pitch = math.radians(self.yaw), math.radians(self.pitch)
+        cos_yaw, sin_yaw = math.cos(yaw), math.sin(yaw)
+        cos_pitch = math.cos(pitch)
+        # Written in place so mouse look does not allocate new arrays.
+        self._fwd[:] = (cos_yaw * cos_pitch, math.sin(pitch), sin_yaw * cos_pitch)
+        self._right[:] = (-sin_yaw, 0.0, cos_yaw)
+        self._dirty = False
+
+    def _move(self, direction, distance):
+        # In place through a scratch vector, so movement allocates no arrays.
+        np.multiply(direction, distance, out=self._scratch)
+        np.add(self.position, self._scratch, out=self.position)
+        self._view_stale = True
+
+    def update(self, keys, mouse_rel, delta_time):
+        """
+        Applies mouse look and keyboard movement for this frame and returns
+        (view_matrix, forward, changed), computing the forward vector only once.
+        view_matrix is a column-major float32 numpy array reused every frame;
+        it is only rebuilt, and changed is only True, when the camera moved.
+        """
         x_offset, y_offset = mouse_rel
-        self.yaw += x_offset * self.mouse_sensitivity
-        self.pitch -= y_offset * self.mouse_sensitivity
-        self.pitch = max(-89.0, min(89.0, self.pitch))
+        if x_offset or y_offset:
+            self.yaw += x_offset * self.mouse_sensitivity
+            self.pitch -= y_offset * self.mouse_sensitivity
+            self.pitch = max(-89.0, min(89.0, self.pitch))
+            self._dirty = True
+            self._view_stale = True
 
         velocity = self.speed * delta_time
         forward = self.get_forward_vector()
-        world_up = glm.vec3(0, 1, 0)
-        right = glm.normalize(glm.cross(forward, world_up))
-        up = world_up
-
-        if keys[K_w]: self.position += forward * velocity
-        if keys[K_s]: self.position -= forward * velocity
-        if keys[K_a]: self.position -= right * velocity
-        if keys[K_d]: self.position += right * velocity
-        if keys[K_SPACE]: self.position += up * velocity
-        if keys[K_LCTRL] or keys[K_LSHIFT]: self.position -= up * velocity
-
-# --- 4. MAIN ENGINE FUNCTION ---
+        right = self._right
+        up = WORLD_UP
+
+        if keys[K_w]: self._move(forward, velocity)
+        if keys[K_s]: self._move(forward, -velocity)
+        if keys[K_a]: self._move(right, -velocity)
+        if keys[K_d]: self._move(right, velocity)
+        if keys[K_SPACE]: self._move(up, velocity)
+        if keys[K_LCTRL] or keys[K_LSHIFT]: self._move(up, -velocity)
+
+        changed = self._view_stale
+        if changed:
+            look_at(self.position, forward, WORLD_UP, self._view_scratch)
+            self._view_stale = False
+        return self._view_scratch, forward, changed
+
+# --- 5. MAIN ENGINE FUNCTION ---
 def main():
     # --- Part 1: Initialization and 2D Loading Screen ---
     pygame.init()
     display_width, display_height = 1280, 720
+    use_vsync = True  # False caps the frame rate with pygame's clock instead
     screen = pygame.display.set_mode((display_width, display_height))
     pygame.display.set_caption("Loading...")
 
@@ -178,29 +548,34 @@ def main():
     if vertices is None:
         pygame.quit()
         return
+    draw_loading_screen(1.0, "Indexing vertices...")
+    vertices, position_scale, position_offset = quantize_positions(vertices)
+    vertices, colors, indices = index_mesh(vertices, colors)
 
     # --- Part 2: Re-initialize in 3D and Setup the Engine ---
-    pygame.display.set_mode((display_width, display_height), DOUBLEBUF | OPENGL)
+    # With VSync the driver paces buffer swaps, so the clock only measures time.
+    frame_cap = 60
+    if use_vsync:
+        try:
+            pygame.display.set_mode((display_width, display_height), DOUBLEBUF | OPENGL, vsync=1)
+            frame_cap = 0
+        except pygame.error:
+            print("VSync unavailable, capping at 60 FPS.")
+    if frame_cap:
+        pygame.display.set_mode((display_width, display_height), DOUBLEBUF | OPENGL)
     pygame.display.set_caption("Triangle Splatting Real-Time Engine")
+    # Only QUIT and KEYDOWN are handled; mouse look reads pygame.mouse.get_rel()
+    # and movement reads pygame.key.get_pressed(), neither of which needs queued
+    # events. Blocking the rest also keeps unread events from filling the queue.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([QUIT, KEYDOWN])
 
     glEnable(GL_DEPTH_TEST)
     glClearColor(0.1, 0.1, 0.1, 1.0)
     
     shader_program = create_shader_program(VERTEX_SHADER, FRAGMENT_SHADER)
 
-    VAO = glGenVertexArrays(1)
-    glBindVertexArray(VAO)
-    VBO_vertices = glGenBuffers(1)
-    glBindBuffer(GL_ARRAY_BUFFER, VBO_vertices)
-    glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
-    glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 0, None)
-    glEnableVertexAttribArray(0)
-    VBO_colors = glGenBuffers(1)
-    glBindBuffer(GL_ARRAY_BUFFER, VBO_colors)
-    glBufferData(GL_ARRAY_BUFFER, colors.nbytes, colors, GL_STATIC_DRAW)
-    glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, 0, None)
-    glEnableVertexAttribArray(1)
-    glBindVertexArray(0)
+    mesh = StaticMeshBuffer(vertices, colors, indices)
 
     # --- Engine Setup ---
     camera = Camera()
@@ -220,36 +595,36 @@ def main():
     model_matrix = glm.rotate(model_matrix, glm.radians(-2.70), glm.vec3(0, 1, 0))  # Yaw
     model_matrix = glm.rotate(model_matrix, glm.radians(-1.35), glm.vec3(0, 0, 1))  # Roll
     glUniformMatrix4fv(model_loc, 1, GL_FALSE, glm.value_ptr(model_matrix))
+    glUniform3fv(glGetUniformLocation(shader_program, "positionScale"), 1, position_scale)
+    glUniform3fv(glGetUniformLocation(shader_program, "positionOffset"), 1, position_offset)
+
+    # The program bound above and this mesh are the only ones used; bind once.
+    mesh.bind()
 
     # --- Part 3: Main Game Loop ---
     running = True
     while running:
-        delta_time = clock.tick(60) / 1000.0
+        delta_time = clock.tick(frame_cap) / 1000.0
         
-        for event in pygame.event.get():
+        for event in pygame.event.get(eventtype=(QUIT, KEYDOWN)):
             if event.type == pygame.QUIT or (event.type == KEYDOWN and event.key == K_ESCAPE):
                 running = False
 
         keys = pygame.key.get_pressed()
         mouse_rel = pygame.mouse.get_rel()
-        camera.process_input(keys, mouse_rel, delta_time)
+        view_matrix, _, view_changed = camera.update(keys, mouse_rel, delta_time)
 
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glUseProgram(shader_program)
-        
-        view_matrix = camera.get_view_matrix()
-        glUniformMatrix4fv(view_loc, 1, GL_FALSE, glm.value_ptr(view_matrix))
-        
-        glBindVertexArray(VAO)
-        glDrawArrays(GL_TRIANGLES, 0, len(vertices))
-        glBindVertexArray(0)
+        # Skip the upload on idle frames; the program keeps the last value.
+        if view_changed:
+            glUniformMatrix4fv(view_loc, 1, GL_FALSE, view_matrix)
+        mesh.draw()
         
         pygame.display.flip()
 
     # --- Cleanup ---
-    glDeleteVertexArrays(1, [VAO])
-    glDeleteBuffers(1, [VBO_vertices])
-    glDeleteBuffers(1, [VBO_colors])
+    glBindVertexArray(0)
+    mesh.delete()
     glDeleteProgram(shader_program)
     pygame.quit()
 
@@ -0,0 +1,31 @@
+# Tests for index_mesh's dedup threshold and first-occurrence ordering.
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import engine
+
+def random_corners(count, seed=0):
+    rng = np.random.default_rng(seed)
+    positions = rng.integers(-32767, 32767, size=(count, 3), dtype=np.int16)
+    colors = rng.integers(0, 256, size=(count, 3), dtype=np.uint8)
+    return positions, colors
+
+def test_mostly_unique_mesh_is_not_indexed():
+    positions, colors = random_corners(300)
+    out_positions, out_colors, indices = engine.index_mesh(positions, colors)
+    assert indices is None
+    np.testing.assert_array_equal(out_positions, positions)
+    np.testing.assert_array_equal(out_colors, colors)
+
+def test_shared_corners_are_indexed_in_first_use_order():
+    positions, colors = random_corners(100)
+    order = np.concatenate([np.arange(100), np.arange(100)[::-1], np.arange(100)])
+    out_positions, out_colors, indices = engine.index_mesh(positions[order], colors[order])
+    assert indices.dtype == np.uint32
+    np.testing.assert_array_equal(indices[:100], np.arange(100))
+    np.testing.assert_array_equal(out_positions[indices], positions[order])
+    np.testing.assert_array_equal(out_colors[indices], colors[order])
@@ -0,0 +1,82 @@
+# Tests for the fallback .off parsers, checked against np.loadtxt.
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import engine
+
+VERTEX_LINES = [
+    "1.5 -2.25 +3",
+    "-0.5e2 1E-3 2.5e+1",
+    ".25 -.75 7.",
+    "0 0 0",
+]
+# (face line, is a triangle)
+FACE_LINES = [
+    ("3 0 1 2 255 128 0", True),
+    ("4 0 1 2 3", False),
+    ("3 1 2 3 10 20 30 255", True),
+    ("4 0 1 2 3 9 9 9", False),
+    ("3 3 2 0 0.0 64.5 1e2", True),
+]
+
+PARSERS = [engine.parse_off_lines]
+if engine.HAVE_NUMBA:
+    PARSERS.append(lambda body, nv, nf: engine.parse_off(np.frombuffer(body, dtype=np.uint8), 0, nv, nf))
+
+def expected_arrays():
+    vertices = np.loadtxt(VERTEX_LINES, dtype=np.float32, ndmin=2)
+    triangles = np.loadtxt([line for line, tri in FACE_LINES if tri], usecols=range(7), ndmin=2)
+    return vertices, triangles[:, 1:4].astype(np.int32), triangles[:, 4:7].astype(np.float32)
+
+def make_body(newline="\n", comments=False):
+    lines = list(VERTEX_LINES) + [line for line, _ in FACE_LINES]
+    if comments:
+        lines = ["# vertices"] + lines[:2] + ["", "  # mid-section comment"] + lines[2:]
+    return newline.join(lines).encode() + newline.encode()
+
+@pytest.mark.parametrize("parse", PARSERS)
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize("comments", [False, True])
+def test_parsers_match_loadtxt(parse, newline, comments):
+    body = make_body(newline, comments)
+    vertices, idx, col = parse(body, len(VERTEX_LINES), len(FACE_LINES))
+    expected_vertices, expected_idx, expected_col = expected_arrays()
+    np.testing.assert_allclose(vertices, expected_vertices, rtol=1e-6)
+    np.testing.assert_array_equal(idx, expected_idx)
+    np.testing.assert_allclose(col, expected_col, rtol=1e-6)
+
+@pytest.mark.parametrize("parse", PARSERS)
+def test_parsers_reject_truncated_body(parse):
+    body = make_body()
+    with pytest.raises(ValueError):
+        parse(body, len(VERTEX_LINES), len(FACE_LINES) + 1)
+
+@pytest.mark.parametrize("parse", PARSERS)
+def test_parsers_reject_triangle_without_color(parse):
+    body = "\n".join(VERTEX_LINES + ["3 0 1 2"]).encode() + b"\n"
+    with pytest.raises(ValueError):
+        parse(body, len(VERTEX_LINES), 1)
+
+def write_off(path, face_lines):
+    header = f"COFF\n{len(VERTEX_LINES)} {len(face_lines)} 0\n"
+    path.write_text(header + "\n".join(VERTEX_LINES + face_lines) + "\n")
+    return str(path)
+
+def test_load_custom_off_fallback_matches_loadtxt_path(tmp_path):
+    triangles = [line for line, tri in FACE_LINES if tri]
+    regular = engine.load_custom_off(write_off(tmp_path / "regular.off", triangles))
+    # The short quad line makes np.loadtxt fail and forces the fallback parser.
+    irregular = engine.load_custom_off(write_off(tmp_path / "irregular.off", [line for line, _ in FACE_LINES]))
+    np.testing.assert_allclose(irregular[0], regular[0])
+    np.testing.assert_array_equal(irregular[1], regular[1])
+    assert len(regular[0]) == 3 * len(triangles)
+
+def test_load_custom_off_rejects_truncated_file(tmp_path):
+    path = tmp_path / "truncated.off"
+    path.write_text(f"OFF\n{len(VERTEX_LINES)} 2 0\n" + "\n".join(VERTEX_LINES) + "\n3 0 1 2 1 2 3\n")
+    assert engine.load_custom_off(str(path)) == (None, None)